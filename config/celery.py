@@ -33,4 +33,12 @@ app.conf.beat_schedule = {
         'task': 'links.tasks.retry_failed_links',
         'schedule': crontab(minute='*/30'), # 30분 주기 (예: 1:00, 1:30, 2:00 ...)
     },
+
+    # 3. 오래 멈춘 PENDING/PROCESSING 링크 정리 (매 1분마다 실행)
+    # 페이지 요청마다 UPDATE를 날리지 않도록 요청 경로에서 분리했습니다.
+    # (docker-compose의 beat 서비스가 떠 있어야 실행됩니다)
+    'sweep-stale-links-every-minute': {
+        'task': 'links.tasks.sweep_stale_links',
+        'schedule': crontab(minute='*/1'),
+    },
 }
\ No newline at end of file
@@ -4,6 +4,7 @@ import logging
 from openai import OpenAI
 
 import numpy as np
+from django.core.cache import cache
 from django.utils import timezone
 from .models import Link, UserProfile
 
@@ -12,6 +13,8 @@ logger = logging.getLogger(__name__)
 api_key = os.environ.get("OPENAI_API_KEY")
 client = OpenAI(api_key=api_key) if api_key else None
 
+EMBEDDING_CACHE_TIMEOUT = 60 * 60 * 24
+
 def generate_summary_and_tags(title, content):
     """
     OpenAI gpt-4o-mini 모델을 사용하여 요약 및 태그 생성
@@ -110,16 +113,59 @@ def get_embeddings_batch(text_list):
         logger.error(f"Batch Embedding Error: {e}")
         return [None] * len(text_list)
 
+
+def get_embeddings_batch_cached(cache_keys, text_list):
+    """
+    cache_keys[i]에 해당하는 임베딩을 캐시에서 먼저 찾고, miss 난 텍스트만 get_embeddings_batch로 벡터화합니다.
+    캐시/반환 모두 float16 배열로 다뤄 payload를 절반으로 줄입니다. (float32 변환은 내적 계산 직전에만)
+    반환 순서는 text_list와 동일, 실패는 None
+    """
+    if not text_list:
+        return []
+
+    try:
+        cached = cache.get_many(cache_keys)
+    except Exception as e:
+        logger.warning(f"Embedding Cache Read Error: {e}")
+        cached = {}
+
+    vectors = [None] * len(text_list)
+    miss_idx = []
+    for i, key in enumerate(cache_keys):
+        raw = cached.get(key)
+        if raw is not None:
+            vectors[i] = np.frombuffer(raw, dtype=np.float16)
+        else:
+            miss_idx.append(i)
+
+    if miss_idx:
+        fresh = get_embeddings_batch([text_list[i] for i in miss_idx])
+        to_cache = {}
+        for i, vec in zip(miss_idx, fresh):
+            if vec is None:
+                continue
+            vectors[i] = np.asarray(vec, dtype=np.float16)
+            to_cache[cache_keys[i]] = vectors[i].tobytes()
+
+        if to_cache:
+            try:
+                cache.set_many(to_cache, timeout=EMBEDDING_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Embedding Cache Write Error: {e}")
+
+    return vectors
+
 def update_user_interest_profile(user_id):
     """
     사용자가 읽은 최근 기사들의 벡터를 시간 가중치(Time-Decay)를 적용하여 평균을 냅니다.
     이 '가중 평균 벡터'가 곧 사용자의 현재 관심사(User Profile)가 됩니다.
+    (cosine 계산에서는 방향만 쓰이므로 L2 정규화된 단위 벡터로 저장)
     """
     try:
-        recent_links = Link.objects.filter(
+        recent_links = list(Link.objects.filter(
             user_id=user_id,
             embedding__isnull=False
-        ).order_by('-created_at')[:50]
+        ).order_by('-created_at').values_list('embedding', 'created_at')[:50])
 
         if not recent_links:
             return
@@ -128,9 +174,9 @@ def update_user_interest_profile(user_id):
         weights = []
         now = timezone.now()
 
-        for link in recent_links:
-            vec = np.array(link.embedding, dtype=np.float32)
-            days_diff = (now - link.created_at).days
+        for embedding, created_at in recent_links:
+            vec = embedding.to_numpy().astype(np.float32)
+            days_diff = (now - created_at).days
             days_diff = max(0, days_diff)
             
             weight = 1.0 / (1.0 + 0.1 * days_diff)
@@ -145,7 +191,11 @@ def update_user_interest_profile(user_id):
             weighted_sum = np.sum(embeddings_matrix * weights_array, axis=0)
             total_weight = np.sum(weights_array)
             
-            final_interest_vector = (weighted_sum / total_weight).tolist()
+            mean_vector = weighted_sum / total_weight
+            norm = np.linalg.norm(mean_vector)
+            if norm > 0:
+                mean_vector = mean_vector / norm
+            final_interest_vector = mean_vector.tolist()
 
             profile, created = UserProfile.objects.get_or_create(user_id=user_id)
             profile.interest_vector = final_interest_vector
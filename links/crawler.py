@@ -20,6 +20,13 @@ NAVER_CLIENT_SECRET = getattr(settings, 'NAVER_CLIENT_SECRET', 'YOUR_CLIENT_SECR
 
 logger = logging.getLogger(__name__)
 
+_ARTICLE_PATH_RE = re.compile(r"/(?:mnews/)?article/(?P<oid>\d{3,})/(?P<aid>\d{5,})")
+_OID_AID_QUERY_RE = re.compile(r"oid=(\d+).*aid=(\d+)")
+_KOREAN_DATETIME_RE = re.compile(
+    r"(?P<y>\d{4})\.(?P<m>\d{2})\.(?P<d>\d{2})\.\s*(?P<ap>AM|PM)\s*(?P<h>\d{1,2}):(?P<min>\d{2})"
+)
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
 
 _SESSION: Optional[requests.Session] = None
 
@@ -82,14 +89,14 @@ def parse_naver_ids_and_normalize_url(url: str) -> Optional[NaverNewsIdentity]:
                 normalized = f"https://n.news.naver.com/mnews/article/{oid}/{aid}"
                 return NaverNewsIdentity(oid=oid, aid=aid, normalized_url=normalized)
 
-        m = re.search(r"/(?:mnews/)?article/(?P<oid>\d{3,})/(?P<aid>\d{5,})", path)
+        m = _ARTICLE_PATH_RE.search(path)
         if m:
             oid = m.group("oid")
             aid = m.group("aid")
             normalized = f"https://n.news.naver.com/mnews/article/{oid}/{aid}"
             return NaverNewsIdentity(oid=oid, aid=aid, normalized_url=normalized)
 
-        m2 = re.search(r"oid=(\d+).*aid=(\d+)", parsed.query)
+        m2 = _OID_AID_QUERY_RE.search(parsed.query)
         if m2:
             oid, aid = m2.group(1), m2.group(2)
             if oid.isdigit() and aid.isdigit():
@@ -128,10 +135,7 @@ def parse_korean_datetime(value: str) -> Optional[datetime]:
         return None
     text = value.strip()
 
-    m = re.search(
-        r"(?P<y>\d{4})\.(?P<m>\d{2})\.(?P<d>\d{2})\.\s*(?P<ap>AM|PM)\s*(?P<h>\d{1,2}):(?P<min>\d{2})",
-        text
-    )
+    m = _KOREAN_DATETIME_RE.search(text)
     if not m:
         return None
 
@@ -240,7 +244,7 @@ def clean_article_text(container) -> str:
 
     text = container.get_text(separator="\n", strip=True)
 
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = _MULTI_NEWLINE_RE.sub("\n\n", text).strip()
     return text
 
 
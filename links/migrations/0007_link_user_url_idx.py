@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0006_userprofile_stats_snapshot_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='link',
+            index=models.Index(fields=['user', 'url'], name='link_user_url_idx'),
+        ),
+    ]
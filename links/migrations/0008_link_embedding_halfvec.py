@@ -0,0 +1,19 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:33
+
+from django.db import migrations
+import pgvector.django.halfvec
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0007_link_user_url_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='link',
+            name='embedding',
+            field=pgvector.django.halfvec.HalfVectorField(blank=True, dimensions=1536, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:33
+
+from django.db import migrations
+import pgvector.django.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0008_link_embedding_halfvec'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='link',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='link_embedding_hnsw', opclasses=['halfvec_cosine_ops']),
+        ),
+    ]
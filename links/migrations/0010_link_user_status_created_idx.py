@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0009_link_embedding_hnsw'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='link',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='link_user_status_created_idx'),
+        ),
+    ]
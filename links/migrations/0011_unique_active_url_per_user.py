@@ -0,0 +1,33 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0010_link_user_status_created_idx'),
+    ]
+
+    operations = [
+        # 기존에 중복으로 대기/처리중인 링크가 있으면 가장 최근 것만 남기고 FAILED 처리
+        migrations.RunSQL(
+            sql="""
+                UPDATE links_link AS l
+                SET status = 'FAILED', failed_reason = 'DUPLICATE_ENTRY'
+                WHERE l.status IN ('PENDING', 'PROCESSING')
+                  AND EXISTS (
+                      SELECT 1 FROM links_link AS o
+                      WHERE o.user_id = l.user_id
+                        AND o.url = l.url
+                        AND o.status IN ('PENDING', 'PROCESSING')
+                        AND o.id > l.id
+                  )
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='link',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['PENDING', 'PROCESSING'])), fields=('user', 'url'), name='unique_active_url_per_user'),
+        ),
+    ]
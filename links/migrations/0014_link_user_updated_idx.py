@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0013_link_status_updated_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='link',
+            index=models.Index(fields=['user', 'updated_at'], name='link_user_updated_idx'),
+        ),
+    ]
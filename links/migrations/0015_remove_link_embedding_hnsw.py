@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-16 09:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('links', '0014_link_user_updated_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='link',
+            name='link_embedding_hnsw',
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import User
-from pgvector.django import VectorField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
+from pgvector.django import HalfVectorField, VectorField
 
 class Link(models.Model):
     STATUS_CHOICES = [
@@ -35,7 +37,7 @@ class Link(models.Model):
     summary = models.TextField(blank=True)
     tags = models.JSONField(default=list, blank=True) 
 
-    embedding = VectorField(dimensions=1536, null=True, blank=True)
+    embedding = HalfVectorField(dimensions=1536, null=True, blank=True)  # fp16(halfvec)로 저장해 행/인덱스 크기를 절반으로
 
     publisher = models.CharField(max_length=50, blank=True)
     published_at = models.DateTimeField(null=True, blank=True)
@@ -54,7 +56,24 @@ class Link(models.Model):
             models.UniqueConstraint(
                 fields=['user', 'naver_oid', 'naver_aid'], 
                 name='unique_naver_news_per_user'
-            )
+            ),
+            # 같은 URL을 동시에 두 번 대기/처리하지 않도록 DB가 보장 (뷰에서 잠금 없이 INSERT 후 충돌 처리)
+            models.UniqueConstraint(
+                fields=['user', 'url'],
+                condition=models.Q(status__in=['PENDING', 'PROCESSING']),
+                name='unique_active_url_per_user'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'url'], name='link_user_url_idx'),
+            models.Index(fields=['user', 'status', '-created_at'], name='link_user_status_created_idx'),
+            models.Index(fields=['status', 'updated_at'], name='link_status_updated_idx'),
+            models.Index(fields=['user', 'updated_at'], name='link_user_updated_idx'),
+            # 검색(icontains = UPPER(col) LIKE UPPER('%q%'))용 trigram GIN 인덱스
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='link_title_trgm_idx'),
+            GinIndex(OpClass(Upper('publisher'), name='gin_trgm_ops'), name='link_publisher_trgm_idx'),
+            GinIndex(OpClass(Upper('summary'), name='gin_trgm_ops'), name='link_summary_trgm_idx'),
+            GinIndex(OpClass(Upper('content'), name='gin_trgm_ops'), name='link_content_trgm_idx'),
         ]
 
     def __str__(self):
@@ -76,9 +95,15 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
-from django.db.models.signals import post_save
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
+logger = logging.getLogger(__name__)
+
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
@@ -86,4 +111,24 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
\ No newline at end of file
+    instance.profile.save()
+
+def user_link_urls_cache_key(user_id):
+    return f"user:{user_id}:link_urls"
+
+def _delete_user_link_urls(user_id):
+    try:
+        cache.delete(user_link_urls_cache_key(user_id))
+    except Exception as e:
+        # 삭제 실패 시 이미 가진 URL이 추천될 수 있으므로 로그를 남깁니다.
+        logger.warning(f"[link_urls] cache delete error user={user_id}: {e}")
+
+def invalidate_user_link_urls(user_id):
+    # 트랜잭션 안에서 지우면 커밋 전 동시 조회가 옛 DB 상태를 다시 캐시할 수 있어, 커밋 후에 지웁니다.
+    # (트랜잭션 밖이면 on_commit은 즉시 실행)
+    transaction.on_commit(lambda: _delete_user_link_urls(user_id))
+
+@receiver(post_save, sender=Link)
+@receiver(post_delete, sender=Link)
+def invalidate_link_url_cache(sender, instance, **kwargs):
+    invalidate_user_link_urls(instance.user_id)
@@ -0,0 +1,21 @@
+import orjson
+
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    DRF 기본 JSONRenderer(stdlib json) 대신 orjson으로 응답을 직렬화합니다.
+    orjson은 비ASCII를 이스케이프하지 않으므로 DRF 기본값(UNICODE_JSON=True)과 출력이 같습니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        option = orjson.OPT_NON_STR_KEYS
+        # Browsable API / "Accept: application/json; indent=4" 요청은 들여쓰기 출력 (orjson은 2칸만 지원)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        # ErrorDetail(str 하위 클래스), datetime 등은 orjson이 직접 처리하고, 나머지(lazy 문자열, Decimal 등)는 str로
+        return orjson.dumps(data, default=str, option=option)
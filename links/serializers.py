@@ -13,4 +13,17 @@ class LinkSerializer(serializers.ModelSerializer):
             'id', 'title', 'content', 'summary', 'image_url', 
             'publisher', 'published_at', 'status', 'failed_reason', 
             'created_at', 'updated_at'
-        ]
\ No newline at end of file
+        ]
+
+class LinkListSerializer(serializers.ModelSerializer):
+    """
+    목록 API용 경량 시리얼라이저: 본문(content)은 상세 API(LinkDetailView)에서만 내려줍니다.
+    """
+    class Meta:
+        model = Link
+        fields = [
+            'id', 'url', 'title', 'summary', 'image_url', 
+            'publisher', 'published_at', 'status', 'failed_reason', 
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
@@ -1,27 +1,43 @@
 import html
-import difflib
 import logging
 import numpy as np
 import re
 
-from datetime import timedelta
 from collections import Counter
-from celery import shared_task
+from datetime import datetime, time, timedelta
+from email.utils import parsedate_to_datetime
+from celery import group, shared_task
 from django.contrib.auth.models import User
 from django.db import transaction, IntegrityError
+from django.db.models import Count, Exists, F, OuterRef
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from dateutil import parser as date_parser
-from pgvector.django import CosineDistance
 
-from .models import Link, UserProfile
+from django.core.cache import cache
+
+from .models import Link, UserProfile, user_link_urls_cache_key, invalidate_user_link_urls
+from .utils import (
+    title_shingles,
+    TitleShingleIndex,
+    TITLE_DUP_JACCARD,
+    unit_vector,
+    cosine_similarities,
+    completed_links_count_and_version,
+    determine_persona,
+    tag_category,
+    top_tags,
+    CATEGORY_KEYWORDS,
+)
 from .crawler import get_naver_news_info, search_naver_news, parse_naver_ids_and_normalize_url
 from .ai import (
     generate_summary_and_tags, 
     get_embedding, 
-    get_embeddings_batch, 
+    get_embeddings_batch_cached,
     update_user_interest_profile, 
     get_recommendation_keywords,
     get_exploration_keywords,
+    analyze_user_interest,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,25 +46,109 @@ RETRYABLE_REASON_PREFIXES = (
     "FETCH_TIMEOUT", "FETCH_REQUEST_EXCEPTION", "CONNECTION_FAILED", "NETWORK_ERROR",
 )
 RETRYABLE_HTTP_STATUS = {429, 500, 502, 503, 504}
+USER_LINK_URLS_CACHE_TIMEOUT = 60 * 60
+
+# n.news.naver.com / m.news.naver.com 도 포함 (부분 문자열 검사)
+_NAVER_NEWS_HOSTS = ("news.naver.com",)
+
+_NAVER_ARTICLE_RE = re.compile(
+    r"article/\d+/\d+"          # n.news.naver.com/article/001/000123
+    r"|read\.nhn\?.*oid=\d+"    # news.naver.com/main/read.nhn?oid=001&aid=123
+)
+
+_BOLD_RE = re.compile(r"</?b>")
+
+def _clean_naver_text(text):
+    """네이버 검색 결과의 HTML entity와 <b> 하이라이트 태그를 제거합니다."""
+    return _BOLD_RE.sub("", html.unescape(text or ""))
 
 def is_valid_naver_article(url):
     """
     URL이 네이버 뉴스 본문 페이지인지 (oid, aid 추출 가능한지) 확인합니다.
     """
-    patterns = [
-        r"article/(\d+)/(\d+)",       # n.news.naver.com/article/001/000123
-        r"read\.nhn\?.*oid=(\d+)",    # news.naver.com/main/read.nhn?oid=001&aid=123
-    ]
-    return any(re.search(p, url) for p in patterns)
+    return _NAVER_ARTICLE_RE.search(url) is not None
+
+
+def get_user_link_urls(user_id):
+    """
+    사용자가 이미 가진 Link URL 집합을 반환합니다. (캐시 우선, Link 저장/삭제 시그널 및 bulk_create 후 무효화)
+    """
+    key = user_link_urls_cache_key(user_id)
+    try:
+        urls = cache.get(key)
+    except Exception:
+        urls = None
+
+    if urls is None:
+        urls = set(Link.objects.filter(user_id=user_id).values_list("url", flat=True).iterator(chunk_size=2000))
+        try:
+            cache.set(key, urls, timeout=USER_LINK_URLS_CACHE_TIMEOUT)
+        except Exception:
+            pass
+    return urls
+
+
+def _hours_since_published(pub_dates, now):
+    """
+    pubDate 문자열 목록을 한 번에 파싱해 now 기준 경과 시간(hour) 배열로 반환합니다.
+    네이버 pubDate는 RFC 2822 형식이라 전용 파서를 먼저 쓰고, 실패 시에만 dateutil로 처리합니다.
+    비어있거나 파싱할 수 없는 값은 NaN.
+    """
+    pub_ts = np.full(len(pub_dates), np.nan, dtype=np.float64)
+    for i, raw in enumerate(pub_dates):
+        if not raw:
+            continue
+        try:
+            try:
+                pub_date = parsedate_to_datetime(raw)
+            except (TypeError, ValueError):
+                pub_date = date_parser.parse(raw)
+            if pub_date.tzinfo is None:
+                pub_date = timezone.make_aware(pub_date, timezone.get_current_timezone())
+            pub_ts[i] = pub_date.timestamp()
+        except Exception:
+            continue
+    return np.maximum(0.0, (now.timestamp() - pub_ts) / 3600)
+
+
+def _score_exploit_candidates(sims, hours, kw_mask):
+    """
+    관심사 기반 추천 점수 계산 (similarity 0.7 + recency 0.2 + keyword 0.1)
+    - 입력은 후보 순서대로 정렬된 병렬 배열, 반환은 (final, recency) float32 배열
+    """
+    recency = np.select(
+        [hours < 1, hours < 6, hours < 12, hours < 24],
+        [1.0, 0.9, 0.8, 0.6],
+        default=np.maximum(0.0, 0.5 - (hours / 24) * 0.15),
+    )
+    recency = np.where(np.isnan(hours), 0.5, recency).astype(np.float32)
+    final = (sims * 0.7) + (recency * 0.2) + (kw_mask * 0.1)
+    return final.astype(np.float32, copy=False), recency
 
 
-@shared_task(bind=True, max_retries=3)
+def _score_explore_candidates(sims, hours):
+    """
+    탐험 추천 점수 계산 (novelty 0.45 + recency 0.35 + similarity 0.20)
+    - 반환은 (final, recency) float32 배열
+    """
+    recency = np.select(
+        [hours < 6, hours < 24],
+        [1.0, 0.8],
+        default=np.maximum(0.3, 0.7 - (hours / 24) * 0.1),
+    )
+    recency = np.where(np.isnan(hours), 0.5, recency).astype(np.float32)
+    novelty = 1.0 - sims
+    final = (novelty * 0.45) + (recency * 0.35) + (sims * 0.20)
+    return final.astype(np.float32, copy=False), recency
+
+
+@shared_task(bind=True, max_retries=3, ignore_result=True)
 def crawl_and_save_link(self, link_id: int):
     with transaction.atomic():
-        try:
-            link = Link.objects.select_for_update().get(id=link_id)
-        except Link.DoesNotExist:
-            return "Link not found"
+        # 다른 워커가 잡고 있는 row는 기다리지 않고 건너뜀
+        link = Link.objects.select_for_update(skip_locked=True).filter(id=link_id).first()
+        if link is None:
+            return f"Link {link_id} not found or locked by another worker"
         
         if link.status in ("COMPLETED", "PARTIAL", "FAILED"):
             return f"Link {link_id} already finalized"
@@ -56,7 +156,7 @@ def crawl_and_save_link(self, link_id: int):
             return f"Link {link_id} already processing"
 
         link.status = "PROCESSING"
-        link.save(update_fields=["status"])
+        link.save(update_fields=["status", "updated_at"])
         url_to_crawl = link.url
         user_id = link.user_id
 
@@ -68,18 +168,18 @@ def crawl_and_save_link(self, link_id: int):
         is_retryable = (http_status in RETRYABLE_HTTP_STATUS) or any(reason.startswith(pfx) for pfx in RETRYABLE_REASON_PREFIXES)
 
         if data.get("status") == "FAILED" and is_retryable:
-            with transaction.atomic():
-                link = Link.objects.select_for_update().get(id=link_id)
-                link.retry_count = (link.retry_count or 0) + 1
-                link.failed_reason = f"RETRYING: {reason}"
-                link.save()
+            Link.objects.filter(id=link_id).update(
+                retry_count=F("retry_count") + 1,
+                failed_reason=f"RETRYING: {reason}",
+                updated_at=timezone.now(),
+            )
             raise self.retry(exc=Exception(reason), countdown=60)
     except self.MaxRetriesExceededError:
-        with transaction.atomic():
-            link = Link.objects.select_for_update().get(id=link_id)
-            link.status = "FAILED"
-            link.failed_reason = "MAX_RETRIES_EXCEEDED"
-            link.save()
+        Link.objects.filter(id=link_id).update(
+            status="FAILED",
+            failed_reason="MAX_RETRIES_EXCEEDED",
+            updated_at=timezone.now(),
+        )
         return "Max retries exceeded"
     except Exception:
         raise
@@ -143,7 +243,7 @@ def crawl_and_save_link(self, link_id: int):
             return "Duplicate link"
 
 
-@shared_task
+@shared_task(ignore_result=True)
 def recommend_articles_for_user(user_id: int):
     """
     사용자의 '관심사 기반' 추천 (Exploit)
@@ -158,7 +258,7 @@ def recommend_articles_for_user(user_id: int):
             if profile.interest_vector is None:
                 logger.info(f"[Exploit] user={user_id} has no interest_vector")
                 return "No interest vector"
-            user_vector = np.array(profile.interest_vector, dtype=np.float32)
+            user_vector = unit_vector(profile.interest_vector)
         except UserProfile.DoesNotExist:
             return "No user profile"
 
@@ -166,39 +266,34 @@ def recommend_articles_for_user(user_id: int):
         one_day_ago = now - timedelta(days=1)
         one_month_ago = now - timedelta(days=30)
 
-        short_links = Link.objects.filter(
-            user=user,
-            status="COMPLETED",
-            created_at__gte=one_day_ago
-        ).order_by("-created_at")[:5]
+        # 최근 한 달 이력을 한 번에 가져와 단기/장기 신호를 파이썬에서 나눕니다.
+        history = list(
+            Link.objects.filter(
+                user=user,
+                status="COMPLETED",
+                created_at__gte=one_month_ago
+            ).order_by("-created_at").values_list("title", "tags", "embedding", "created_at")
+        )
 
-        short_term_text = "\n".join([f"- {l.title}" for l in short_links])
+        short_titles = [title for title, _, _, created_at in history if created_at >= one_day_ago][:5]
 
-        long_qs = Link.objects.filter(
-            user=user,
-            status="COMPLETED",
-            created_at__gte=one_month_ago
-        )
+        short_term_text = "\n".join([f"- {t}" for t in short_titles])
 
-        all_tags = []
-        for tags in long_qs.values_list("tags", flat=True):
-            if tags:
-                all_tags.extend(tags)
-        top_tags = [t for t, _ in Counter(all_tags).most_common(5)]
+        tag_counts = Counter(
+            tag
+            for _, tags, _, _ in history if isinstance(tags, list)
+            for tag in tags
+        )
+        top_tag_names = [t for t, _ in sorted(tag_counts.items(), key=lambda x: (-x[1], x[0]))[:5]]
 
+        embedded = [(title, emb.to_numpy()) for title, _, emb, _ in history if emb is not None]
         core_titles = []
-        core_links = Link.objects.filter(
-            user=user,
-            status="COMPLETED",
-            created_at__gte=one_month_ago,
-            embedding__isnull=False
-        ).annotate(
-            distance=CosineDistance("embedding", profile.interest_vector)
-        ).order_by("distance")[:3]
-        core_titles = [l.title for l in core_links]
+        if embedded:
+            core_sims = cosine_similarities([vec for _, vec in embedded], user_vector)
+            core_titles = [embedded[j][0] for j in np.argsort(-core_sims, kind="stable")[:3]]
 
         long_term_text = (
-            f"Top Tags: {', '.join(top_tags)}\n"
+            f"Top Tags: {', '.join(top_tag_names)}\n"
             f"Representative Articles: {', '.join(core_titles)}"
         )
 
@@ -213,7 +308,7 @@ def recommend_articles_for_user(user_id: int):
 
         from .recommend_utils import normalize_naver_candidate
 
-        existing_urls = set(Link.objects.filter(user=user).values_list("url", flat=True))
+        existing_urls = get_user_link_urls(user.id)
         seen_urls = set()
 
         raw_candidates = []
@@ -221,7 +316,9 @@ def recommend_articles_for_user(user_id: int):
             items = search_naver_news(kw, display=100)
 
             for item in items:
-                raw_url = item.get("link")
+                raw_url = item.get("link") or ""
+                if not any(h in raw_url for h in _NAVER_NEWS_HOSTS):
+                    continue
                 ident = normalize_naver_candidate(raw_url)
                 if not ident:
                     continue
@@ -232,8 +329,8 @@ def recommend_articles_for_user(user_id: int):
 
                 seen_urls.add(url)
 
-                clean_title = html.unescape(item.get("title", "")).replace("<b>", "").replace("</b>", "")
-                clean_desc = html.unescape(item.get("description", "")).replace("<b>", "").replace("</b>", "")
+                clean_title = _clean_naver_text(item.get("title"))
+                clean_desc = _clean_naver_text(item.get("description"))
 
                 raw_candidates.append({
                     "url": url,
@@ -249,58 +346,41 @@ def recommend_articles_for_user(user_id: int):
         if not raw_candidates:
             return "No candidates"
 
-        TITLE_SIM_THRESHOLD = 0.6
         unique_candidates = []
+        unique_index = TitleShingleIndex()
         for cand in raw_candidates:
-            dup = False
-            for u in unique_candidates:
-                if difflib.SequenceMatcher(None, cand["title"], u["title"]).ratio() > TITLE_SIM_THRESHOLD:
-                    dup = True
-                    break
-            if not dup:
-                unique_candidates.append(cand)
+            shingles = title_shingles(cand["title"])
+            if unique_index.is_too_similar(shingles, threshold=TITLE_DUP_JACCARD):
+                continue
+            unique_candidates.append(cand)
+            unique_index.add(shingles)
 
         logger.info(f"[Exploit] user={user_id} unique_candidates={len(unique_candidates)}")
         if not unique_candidates:
             return "No unique candidates"
 
-        texts_to_embed = [f"{c['title']}\n{c['desc']}" for c in unique_candidates]
-        vectors = get_embeddings_batch(texts_to_embed)
+        kw_mask = np.fromiter(
+            (bool(c["keyword"]) and c["keyword"] in c["title"] for c in unique_candidates),
+            dtype=np.float32,
+            count=len(unique_candidates),
+        )
 
-        scored = []
-        norm_u = np.linalg.norm(user_vector)
+        texts_to_embed = [f"{c['title']}\n{c['desc']}" for c in unique_candidates]
+        cache_keys = [f"emb:{c['oid']}:{c['aid']}" for c in unique_candidates]
+        vectors = get_embeddings_batch_cached(cache_keys, texts_to_embed)
 
-        for cand, vec in zip(unique_candidates, vectors):
-            if vec is None:
-                continue
+        valid_idx = [i for i, vec in enumerate(vectors) if vec is not None]
+        sims = cosine_similarities([vectors[i] for i in valid_idx], user_vector)
 
-            cand_vec = np.array(vec, dtype=np.float32)
-            norm_c = np.linalg.norm(cand_vec)
-            similarity = (np.dot(user_vector, cand_vec) / (norm_u * norm_c)) if (norm_u > 0 and norm_c > 0) else 0.0
+        hours = _hours_since_published([unique_candidates[i]["pubDate"] for i in valid_idx], now)
+        kw_scores = kw_mask[valid_idx]
+        final_scores, recency = _score_exploit_candidates(sims, hours, kw_scores)
 
-            recency_score = 0.5
-            try:
-                pub_date = date_parser.parse(cand["pubDate"]) if cand["pubDate"] else None
-                if pub_date:
-                    if pub_date.tzinfo is None:
-                        pub_date = timezone.make_aware(pub_date, timezone.get_current_timezone())
-                    hours = max(0, (now - pub_date).total_seconds()) / 3600
-                    if hours < 1: recency_score = 1.0
-                    elif hours < 6: recency_score = 0.9
-                    elif hours < 12: recency_score = 0.8
-                    elif hours < 24: recency_score = 0.6
-                    else:
-                        days = hours / 24
-                        recency_score = max(0.0, 0.5 - days * 0.15)
-            except Exception:
-                recency_score = 0.5
-
-            keyword_score = 1.0 if (cand["keyword"] and cand["keyword"] in cand["title"]) else 0.0
-            final_score = (similarity * 0.7) + (recency_score * 0.2) + (keyword_score * 0.1)
-
-            scored.append((final_score, similarity, recency_score, keyword_score, cand))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
+        order = np.argsort(-final_scores, kind="stable")
+        scored = [
+            (float(final_scores[j]), float(sims[j]), float(recency[j]), float(kw_scores[j]), unique_candidates[valid_idx[j]])
+            for j in order
+        ]
         if not scored:
             return "No scored candidates"
 
@@ -326,13 +406,13 @@ def recommend_articles_for_user(user_id: int):
                 final_top.append((s, sim, r, k, cand))
                 picked.add(cand["url"])
 
-        saved = 0
         with transaction.atomic():
-            for s, sim, r, k, cand in final_top:
-                if Link.objects.filter(user=user, url=cand["url"]).exists():
-                    continue
-
-                Link.objects.create(
+            taken = set(
+                Link.objects.filter(user=user, url__in=[x[4]["url"] for x in final_top])
+                .values_list("url", flat=True)
+            )
+            new_links = [
+                Link(
                     user=user,
                     url=cand["url"],
                     naver_oid=cand["oid"],
@@ -343,10 +423,18 @@ def recommend_articles_for_user(user_id: int):
                     recommendation_type="PERSONAL",
                     failed_reason=f"[Exploit] score={s:.4f} sim={sim:.4f} recency={r:.2f} kw={cand['keyword']}"
                 )
-                saved += 1
-
-        logger.info(f"[Exploit] user={user_id} saved={saved}")
-        return f"Saved {saved}"
+                for s, sim, r, k, cand in final_top
+                if cand["url"] not in taken
+            ]
+            # (user, oid, aid) 유니크 충돌(동시 실행 등)은 DB에서 무시
+            # ignore_conflicts는 건너뛴 행을 알려주지 않으므로 실제 저장 수가 아닌 "시도한 수"입니다.
+            Link.objects.bulk_create(new_links, ignore_conflicts=True)
+            attempted = len(new_links)
+        if attempted:
+            invalidate_user_link_urls(user.id)
+
+        logger.info(f"[Exploit] user={user_id} attempted={attempted}")
+        return f"Attempted {attempted}"
 
     except Exception as e:
         logger.error(f"[Exploit] Error user={user_id}: {e}", exc_info=True)
@@ -356,35 +444,70 @@ def recommend_articles_for_user(user_id: int):
 @shared_task
 def retry_failed_links():
     """주기적 재시도 태스크"""
-    failed_links = Link.objects.filter(status='FAILED', retry_count__lt=3)
-    count = 0
-    for link in failed_links:
-        link.status = 'PENDING'
-        link.save()
-        crawl_and_save_link.delay(link.id)
-        count += 1
-    return f"Retried {count} failed links."
+    # (user, url)당 활성 링크는 하나만 허용되므로, 이미 대기/처리중인 URL은 건너뛰고 같은 URL은 최신 하나만 재시도
+    active = Link.objects.filter(
+        user=OuterRef('user'), url=OuterRef('url'), status__in=['PENDING', 'PROCESSING']
+    )
+    ids = list(
+        Link.objects.filter(status='FAILED', retry_count__lt=3)
+        .exclude(Exists(active))
+        .order_by('user_id', 'url', '-id')
+        .distinct('user_id', 'url')
+        .values_list('id', flat=True)
+    )
+    if not ids:
+        return "Retried 0 failed links."
+
+    try:
+        Link.objects.filter(id__in=ids, status='FAILED').update(status='PENDING', updated_at=timezone.now())
+    except IntegrityError:
+        # 조회 이후 같은 URL이 새로 등록된 경우: 이번 주기는 건너뛰고 다음 주기에 재시도
+        logger.warning("[retry_failed_links] active URL conflict, skipped this run")
+        return "Retried 0 failed links."
+    group(crawl_and_save_link.s(link_id) for link_id in ids).apply_async()
+    return f"Retried {len(ids)} failed links."
+
+
+@shared_task(ignore_result=True)
+def sweep_stale_links():
+    """
+    10분 넘게 PENDING/PROCESSING에 머문 링크를 FAILED로 정리하는 주기 태스크
+    (updated_at도 갱신해 link_list 캐시 버전이 바뀌도록 함)
+    """
+    now = timezone.now()
+    stale_cutoff = now - timedelta(minutes=10)
+    processing = Link.objects.filter(
+        status='PROCESSING',
+        updated_at__lt=stale_cutoff
+    ).update(status='FAILED', failed_reason='STALE_PROCESSING_TIMEOUT', updated_at=now)
+
+    pending = Link.objects.filter(
+        status='PENDING',
+        updated_at__lt=stale_cutoff
+    ).update(status='FAILED', failed_reason='STALE_PENDING_TIMEOUT', updated_at=now)
+
+    return f"Swept {processing} processing, {pending} pending links."
 
 
 @shared_task
 def recommend_articles_daily():
     """모든 유저 대상 추천 실행"""
-    for user in User.objects.all():
-        recommend_articles_for_user.delay(user.id)
+    user_ids = User.objects.values_list("id", flat=True).iterator(chunk_size=1000)
+    group(recommend_articles_for_user.s(uid) for uid in user_ids).apply_async()
     return "Started tasks"
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-@shared_task
+@shared_task(ignore_result=True)
 def recommend_exploratory_articles(user_id: int):
     """
     사용자의 '지식 공백' 기반 추천 (Explore)
     - strong/weak 카테고리에서 "브릿지 키워드 + 와일드카드"로 탐험 추천
     - 너무 취향에 붙는 기사(similarity 너무 높음)는 제외 (새로움 확보)
     """
-    from .utils import analyze_knowledge_gap, is_within_six_months, is_too_similar
+    from .utils import analyze_knowledge_gap, is_within_six_months
     from .recommend_utils import normalize_naver_candidate
 
     try:
@@ -393,9 +516,9 @@ def recommend_exploratory_articles(user_id: int):
         if not profile or profile.interest_vector is None:
             return "User vector not found"
 
-        user_vector = np.array(profile.interest_vector, dtype=np.float32)
-        norm_u = np.linalg.norm(user_vector)
+        user_vector = unit_vector(profile.interest_vector)
         now = timezone.now()
+        six_months_ago = now - timedelta(days=180)
 
         strong, weak = analyze_knowledge_gap(user)
         keywords = get_exploration_keywords(strong, weak)
@@ -404,8 +527,12 @@ def recommend_exploratory_articles(user_id: int):
 
         logger.info(f"[Explore] user={user_id} strong={strong} weak={weak} keywords={keywords}")
 
-        existing_urls = set(Link.objects.filter(user=user).values_list("url", flat=True))
-        existing_titles = list(Link.objects.filter(user=user).values_list("title", flat=True))
+        existing_urls = get_user_link_urls(user.id)
+        # URL 중복은 existing_urls에서 이미 걸러지므로, 제목 비교는 실제 제목이 있는 기사만 대상으로
+        existing_index = TitleShingleIndex(
+            title_shingles(t)
+            for t in Link.objects.filter(user=user).exclude(title="").values_list("title", flat=True)
+        )
 
         candidates = []
         seen_urls = set()
@@ -414,7 +541,9 @@ def recommend_exploratory_articles(user_id: int):
             items = search_naver_news(kw, display=80)
 
             for item in items:
-                raw_url = item.get("link")
+                raw_url = item.get("link") or ""
+                if not any(h in raw_url for h in _NAVER_NEWS_HOSTS):
+                    continue
                 ident = normalize_naver_candidate(raw_url)
                 if not ident:
                     continue
@@ -424,17 +553,18 @@ def recommend_exploratory_articles(user_id: int):
                     continue
 
                 pub_raw = item.get("pubDate") or ""
-                if not is_within_six_months(pub_raw):
+                if not is_within_six_months(pub_raw, six_months_ago):
                     continue
 
-                clean_title = html.unescape(item.get("title", "")).replace("<b>", "").replace("</b>", "")
-                if is_too_similar(clean_title, existing_titles):
+                clean_title = _clean_naver_text(item.get("title"))
+                shingles = title_shingles(clean_title)
+                if existing_index.is_too_similar(shingles, threshold=TITLE_DUP_JACCARD):
                     continue
 
                 seen_urls.add(url)
-                existing_titles.append(clean_title)
+                existing_index.add(shingles)
 
-                clean_desc = html.unescape(item.get("description", "")).replace("<b>", "").replace("</b>", "")
+                clean_desc = _clean_naver_text(item.get("description"))
 
                 candidates.append({
                     "url": url,
@@ -451,58 +581,37 @@ def recommend_exploratory_articles(user_id: int):
             return "No candidates"
 
         texts = [f"{c['title']}\n{c['desc']}" for c in candidates]
-        vectors = get_embeddings_batch(texts)
+        cache_keys = [f"emb:{c['oid']}:{c['aid']}" for c in candidates]
+        vectors = get_embeddings_batch_cached(cache_keys, texts)
 
-        scored = []
-        for cand, vec in zip(candidates, vectors):
-            if vec is None:
-                continue
+        valid_idx = [i for i, vec in enumerate(vectors) if vec is not None]
+        sims = cosine_similarities([vectors[i] for i in valid_idx], user_vector)
 
-            cand_vec = np.array(vec, dtype=np.float32)
-            norm_c = np.linalg.norm(cand_vec)
+        # 너무 취향에 붙거나(>0.85) 너무 동떨어진(<0.15) 후보는 제외
+        keep = np.flatnonzero((sims >= 0.15) & (sims <= 0.85))
+        sims = sims[keep]
+        kept_idx = [valid_idx[j] for j in keep]
 
-            sim = (np.dot(user_vector, cand_vec) / (norm_u * norm_c)) if (norm_u > 0 and norm_c > 0) else 0.0
+        hours = _hours_since_published([candidates[i]["pubDate"] for i in kept_idx], now)
+        final_scores, recency = _score_explore_candidates(sims, hours)
 
-            if sim > 0.85:
-                continue
-            if sim < 0.15:
-                continue
-
-            recency_score = 0.5
-            try:
-                pub_date = date_parser.parse(cand["pubDate"]) if cand["pubDate"] else None
-                if pub_date:
-                    if pub_date.tzinfo is None:
-                        pub_date = timezone.make_aware(pub_date, timezone.get_current_timezone())
-                    hours = max(0, (now - pub_date).total_seconds()) / 3600
-                    if hours < 6:
-                        recency_score = 1.0
-                    elif hours < 24:
-                        recency_score = 0.8
-                    else:
-                        days = hours / 24
-                        recency_score = max(0.3, 0.7 - days * 0.1)
-            except Exception:
-                recency_score = 0.5
-
-            novelty = 1.0 - sim
-            final_score = (novelty * 0.45) + (recency_score * 0.35) + (sim * 0.20)
-
-            scored.append((final_score, sim, recency_score, cand))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
+        order = np.argsort(-final_scores, kind="stable")
+        scored = [
+            (float(final_scores[j]), float(sims[j]), float(recency[j]), candidates[kept_idx[j]])
+            for j in order
+        ]
         if not scored:
             return "No scored exploration candidates"
 
         final_picks = scored[:3]
 
-        saved = 0
         with transaction.atomic():
-            for s, sim, r, cand in final_picks:
-                if Link.objects.filter(user=user, url=cand["url"]).exists():
-                    continue
-
-                Link.objects.create(
+            taken = set(
+                Link.objects.filter(user=user, url__in=[x[3]["url"] for x in final_picks])
+                .values_list("url", flat=True)
+            )
+            new_links = [
+                Link(
                     user=user,
                     url=cand["url"],
                     naver_oid=cand["oid"],
@@ -513,11 +622,138 @@ def recommend_exploratory_articles(user_id: int):
                     recommendation_type="EXPLORE",
                     failed_reason=f"[Explore] score={s:.4f} sim={sim:.4f} recency={r:.2f} kw={cand['keyword']}"
                 )
-                saved += 1
-
-        logger.info(f"[Explore] user={user_id} saved={saved}")
-        return f"Saved {saved}"
+                for s, sim, r, cand in final_picks
+                if cand["url"] not in taken
+            ]
+            # (user, oid, aid) 유니크 충돌(동시 실행 등)은 DB에서 무시
+            # ignore_conflicts는 건너뛴 행을 알려주지 않으므로 실제 저장 수가 아닌 "시도한 수"입니다.
+            Link.objects.bulk_create(new_links, ignore_conflicts=True)
+            attempted = len(new_links)
+        if attempted:
+            invalidate_user_link_urls(user.id)
+
+        logger.info(f"[Explore] user={user_id} attempted={attempted}")
+        return f"Attempted {attempted}"
 
     except Exception as e:
         logger.error(f"[Explore] Error user={user_id}: {e}", exc_info=True)
-        return f"Error: {e}"
\ No newline at end of file
+        return f"Error: {e}"
+
+
+STATS_SNAPSHOT_CACHE_TIMEOUT = 60 * 5
+TREND_DAYS = 14
+MIN_INSIGHT_ARTICLES = 5
+INSIGHT_CANDIDATE_LIMIT = 500
+
+
+def build_stats_snapshot(user, profile, completed_links, total_count):
+    """
+    통계 화면에 필요한 값(페르소나, AI 브리핑, 태그/카테고리/추이 차트)을 계산해 snapshot dict로 반환합니다.
+    """
+    ai_insight = None
+    # 기사가 너무 적으면 "대표 기사"를 고를 의미가 없으므로 유사도 계산과 LLM 호출을 건너뛰고,
+    # 화면에는 몇 개를 더 읽어야 하는지 안내합니다.
+    insight_needs_more = 0
+    if profile.interest_vector is None:
+        embedded_count = completed_links.filter(embedding__isnull=False).count()
+        insight_needs_more = max(0, MIN_INSIGHT_ARTICLES - embedded_count)
+    else:
+        # 유저 기사 안에서 정확히 계산합니다. 기사가 아주 많은 유저도 메모리가 일정하도록 최근 기사로 범위를 제한합니다.
+        embedded = list(
+            completed_links.filter(embedding__isnull=False)
+            .order_by("-created_at")
+            .values_list("title", "embedding")[:INSIGHT_CANDIDATE_LIMIT]
+        )
+        insight_needs_more = max(0, MIN_INSIGHT_ARTICLES - len(embedded))
+        if not insight_needs_more:
+            sims = cosine_similarities([emb.to_numpy() for _, emb in embedded], unit_vector(profile.interest_vector))
+            closest_titles = [embedded[j][0] for j in np.argsort(-sims, kind="stable")[:5]]
+            representative_texts = [t for t in closest_titles if t]
+            if representative_texts:
+                try:
+                    ai_insight = analyze_user_interest(representative_texts)
+                except Exception as e:
+                    logger.warning(f"[Stats] analyze_user_interest error user={user.id}: {e}")
+                    ai_insight = None
+
+    persona = determine_persona(completed_links, user_id=user.id)
+
+    # 태그 집계는 DB에서 (jsonb_array_elements_text + GROUP BY)
+    all_tag_counts = top_tags(completed_links, None)
+
+    tag_counts = all_tag_counts[:10]
+    tag_labels = [tag for tag, count in tag_counts]
+    tag_data = [count for tag, count in tag_counts]
+
+    cat_scores = {k: 0 for k in CATEGORY_KEYWORDS.keys()}
+    for tag, count in all_tag_counts:
+        cat = tag_category(tag)
+        if cat:
+            cat_scores[cat] += count
+    cat_labels = list(cat_scores.keys())
+    cat_data = list(cat_scores.values())
+
+    # 최근 14일(오늘 포함)만 DB에서 집계합니다. (전체 기간을 GROUP BY 후 파이썬에서 잘라내지 않음)
+    trend_start = timezone.make_aware(
+        datetime.combine(timezone.localdate() - timedelta(days=TREND_DAYS - 1), time.min)
+    )
+    daily_stats = (
+        completed_links
+        .filter(created_at__gte=trend_start)
+        .annotate(date=TruncDate("created_at"))
+        .values("date")
+        .annotate(count=Count("id"))
+        .order_by("date")
+    )
+    trend_labels = [item["date"].strftime("%m-%d") for item in daily_stats]
+    trend_data = [item["count"] for item in daily_stats]
+
+    return {
+        "persona": persona,
+        "ai_insight": ai_insight,
+        "insight_needs_more": insight_needs_more,
+        "total_count": total_count,
+
+        "tag_labels": tag_labels,
+        "tag_data": tag_data,
+        "cat_labels": cat_labels,
+        "cat_data": cat_data,
+        "trend_labels": trend_labels,
+        "trend_data": trend_data,
+    }
+
+
+@shared_task(ignore_result=True)
+def refresh_stats_snapshot(user_id: int):
+    """
+    통계 snapshot을 다시 계산해 UserProfile.stats_snapshot에 저장합니다. (stats_content 새로고침 버튼에서 큐잉)
+    완료 기사 집합이 그대로면 최근 계산 결과(AI 브리핑 포함)를 캐시에서 재사용합니다.
+    """
+    user = User.objects.get(id=user_id)
+    profile, _ = UserProfile.objects.get_or_create(user=user)
+    completed_links = Link.objects.filter(user=user, status="COMPLETED")
+
+    total_count, version = completed_links_count_and_version(completed_links)
+    cache_key = f"stats_snapshot:{user.id}:{version}"
+    try:
+        snapshot = cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"[Stats] cache read error user={user.id}: {e}")
+        snapshot = None
+
+    if snapshot is None:
+        snapshot = build_stats_snapshot(user, profile, completed_links, total_count)
+        try:
+            cache.set(cache_key, snapshot, timeout=STATS_SNAPSHOT_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"[Stats] cache write error user={user.id}: {e}")
+
+    # 폴링(stats_content_poll)이 완료를 알 수 있도록 갱신 시각은 항상 기록하되,
+    # 내용이 그대로면 큰 JSONB 컬럼은 다시 쓰지 않습니다.
+    update_fields = ["stats_snapshot_updated_at"]
+    if profile.stats_snapshot != snapshot:
+        profile.stats_snapshot = snapshot
+        update_fields.append("stats_snapshot")
+    profile.stats_snapshot_updated_at = timezone.now()
+    profile.save(update_fields=update_fields)
+    return f"Stats snapshot refreshed for user {user_id}"
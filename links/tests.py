@@ -1,3 +1,252 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Link, UserProfile
+from .renderers import OrjsonRenderer
+
+from .utils import TITLE_DUP_JACCARD, TitleShingleIndex, title_shingles
+
+
+class TitleDedupTests(SimpleTestCase):
+    """
+    제목 중복 판정 임계값(TITLE_DUP_JACCARD)이 실제 기사 제목 쌍에서 의도대로 동작하는지 확인합니다.
+    """
+
+    def assertDuplicate(self, existing, new, expected):
+        index = TitleShingleIndex([title_shingles(existing)])
+        self.assertEqual(index.is_too_similar(title_shingles(new), threshold=TITLE_DUP_JACCARD), expected)
+
+    def test_paraphrased_titles_are_duplicates(self):
+        self.assertDuplicate("삼성전자, 3분기 영업이익 10조 돌파", "삼성전자 3분기 영업익 10조원 돌파…반도체 회복", True)
+        self.assertDuplicate("한은, 기준금리 3.5% 동결…7회 연속", "한국은행 기준금리 3.5%로 동결, 7회 연속", True)
+        self.assertDuplicate("서울 아파트값 15주 연속 상승", "서울 아파트 가격 15주째 연속 상승세", True)
+
+    def test_different_stories_are_not_duplicates(self):
+        self.assertDuplicate("한은, 기준금리 3.5% 동결…7회 연속", "미 연준, 기준금리 0.5%p 인하", False)
+        self.assertDuplicate("서울 아파트값 15주 연속 상승", "서울 전셋값 20주 연속 하락", False)
+        self.assertDuplicate("애플, 아이폰16 공개…AI 기능 탑재", "구글, 픽셀9 공개…제미나이 탑재", False)
+
+    def test_index_checks_against_every_added_title(self):
+        index = TitleShingleIndex()
+        index.add(title_shingles("한은, 기준금리 3.5% 동결…7회 연속"))
+        index.add(title_shingles("SK하이닉스, HBM3E 12단 양산 시작"))
+        self.assertTrue(index.is_too_similar(title_shingles("SK하이닉스 HBM3E 12단 세계 최초 양산")))
+        self.assertFalse(index.is_too_similar(title_shingles("삼성전자 HBM4 개발 착수")))
+
+
+class StatsContentPollTests(TestCase):
+    """
+    stats_content(새로고침 큐잉)와 stats_content_poll(완료 폴링/타임아웃)을 확인합니다.
+    """
+
+    SNAPSHOT = {
+        "persona": {"title": "💾 IT 꿈나무", "level": "lv.1"},
+        "ai_insight": "AI에 관심이 많아요.",
+        "total_count": 3,
+        "tag_labels": ["AI"], "tag_data": [3],
+        "cat_labels": ["TECH"], "cat_data": [3],
+        "trend_labels": ["10-15"], "trend_data": [3],
+    }
+
+    def setUp(self):
+        self.user = User.objects.create_user("stats-user", password="pw")
+        self.client.force_login(self.user)
+        self.profile = UserProfile.objects.get(user=self.user)
+
+    def set_snapshot(self, updated_at):
+        self.profile.stats_snapshot = self.SNAPSHOT
+        self.profile.stats_snapshot_updated_at = updated_at
+        self.profile.save(update_fields=["stats_snapshot", "stats_snapshot_updated_at"])
+
+    def poll(self, since):
+        return self.client.get(reverse("stats_content_poll"), {"since": since.timestamp()})
+
+    def test_refresh_enqueues_task_and_returns_pending(self):
+        Link.objects.create(user=self.user, url="https://n.news.naver.com/a/1", status="COMPLETED")
+        with mock.patch("links.views.refresh_stats_snapshot.delay") as delay:
+            res = self.client.get(reverse("stats_content"))
+        delay.assert_called_once_with(self.user.id)
+        self.assertContains(res, "hx-get")
+        self.assertTemplateUsed(res, "links/partials/stats_pending.html")
+
+    def test_pending_while_snapshot_is_older_than_since(self):
+        since = timezone.now()
+        self.set_snapshot(since - timedelta(minutes=5))
+        res = self.poll(since)
+        self.assertTemplateUsed(res, "links/partials/stats_pending.html")
+        self.assertContains(res, f"since={since.timestamp()}")
+
+    def test_ready_once_snapshot_is_updated(self):
+        since = timezone.now() - timedelta(seconds=10)
+        self.set_snapshot(since + timedelta(seconds=5))
+        res = self.poll(since)
+        self.assertTemplateUsed(res, "links/partials/stats_content.html")
+        self.assertContains(res, "AI에 관심이 많아요.")
+        self.assertNotContains(res, "hx-get")
+
+    def test_timeout_falls_back_to_previous_snapshot(self):
+        from .views import STATS_REFRESH_TIMEOUT
+
+        since = timezone.now() - timedelta(seconds=STATS_REFRESH_TIMEOUT + 1)
+        self.set_snapshot(since - timedelta(minutes=5))
+        res = self.poll(since)
+        self.assertTemplateUsed(res, "links/partials/stats_content.html")
+        self.assertNotContains(res, "hx-get")
+
+    def test_timeout_without_snapshot_shows_empty(self):
+        from .views import STATS_REFRESH_TIMEOUT
+
+        since = timezone.now() - timedelta(seconds=STATS_REFRESH_TIMEOUT + 1)
+        res = self.poll(since)
+        self.assertTemplateUsed(res, "links/partials/stats_empty.html")
+
+
+class StatsInsightGateTests(TestCase):
+    """
+    임베딩된 완료 기사가 MIN_INSIGHT_ARTICLES개 미만이면 AI 브리핑 대신 안내 문구를 보여주는지 확인합니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user("insight-user", password="pw")
+        self.profile = UserProfile.objects.get(user=self.user)
+        self.profile.interest_vector = [1.0] + [0.0] * 1535
+        self.profile.save(update_fields=["interest_vector"])
+        for i in range(2):
+            Link.objects.create(
+                user=self.user, url=f"https://n.news.naver.com/a/{i}", title=f"기사 {i}",
+                status="COMPLETED", tags=["AI"], embedding=[1.0] + [0.0] * 1535,
+            )
+
+    def test_few_articles_skip_llm_and_report_shortfall(self):
+        from .tasks import MIN_INSIGHT_ARTICLES, build_stats_snapshot
+
+        completed = Link.objects.filter(user=self.user, status="COMPLETED")
+        with mock.patch("links.tasks.analyze_user_interest") as analyze:
+            snapshot = build_stats_snapshot(self.user, self.profile, completed, completed.count())
+        analyze.assert_not_called()
+        self.assertIsNone(snapshot["ai_insight"])
+        self.assertEqual(snapshot["insight_needs_more"], MIN_INSIGHT_ARTICLES - 2)
+
+    def test_stats_page_shows_not_enough_articles_message(self):
+        # 로그인 시 User 저장 시그널이 profile을 다시 저장하므로 snapshot보다 먼저 로그인합니다.
+        self.client.force_login(self.user)
+        self.profile.stats_snapshot = {"persona": {"title": "💾 IT 꿈나무"}, "ai_insight": None,
+                                       "insight_needs_more": 3, "total_count": 2}
+        self.profile.stats_snapshot_updated_at = timezone.now()
+        self.profile.save(update_fields=["stats_snapshot", "stats_snapshot_updated_at"])
+
+        res = self.client.get(reverse("stats_page"))
+        self.assertContains(res, "아직 분석할 기사가 충분하지 않아요")
+        self.assertContains(res, "기사를 3개 더 읽으면")
+
+
+class BulkLinkCreateTests(TestCase):
+    """
+    LinkCreateView의 {"urls": [...]} 일괄 등록 경로를 확인합니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user("bulk-user", password="pw")
+        self.client.force_login(self.user)
+        patcher = mock.patch("links.views.group")
+        self.group = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post_urls(self, urls):
+        return self.client.post(reverse("api_link_create"), {"urls": urls}, content_type="application/json")
+
+    def queued_ids(self):
+        (signatures,), _ = self.group.call_args
+        return sorted(sig.args[0] for sig in signatures)
+
+    def test_rejects_more_than_max_urls(self):
+        from .views import MAX_BULK_URLS
+
+        urls = [f"https://n.news.naver.com/a/{i}" for i in range(MAX_BULK_URLS + 1)]
+        res = self.post_urls(urls)
+        self.assertEqual(res.status_code, 400)
+        self.assertFalse(Link.objects.exists())
+        self.group.assert_not_called()
+
+    def test_form_encoded_bulk_submit(self):
+        res = self.client.post(
+            reverse("api_link_create"),
+            {"urls": ["https://n.news.naver.com/a/1", "https://n.news.naver.com/a/2"]},
+        )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(
+            [q["url"] for q in res.json()["queued"]],
+            ["https://n.news.naver.com/a/1", "https://n.news.naver.com/a/2"],
+        )
+
+    def test_rejects_non_list_payload(self):
+        res = self.post_urls("https://n.news.naver.com/a/1")
+        self.assertEqual(res.status_code, 400)
+
+    def test_mixed_valid_and_invalid_urls(self):
+        res = self.post_urls(["https://n.news.naver.com/a/1", "https://example.com/x", "", "https://n.news.naver.com/a/2"])
+        self.assertEqual(res.status_code, 201)
+        body = res.json()
+        self.assertEqual([q["url"] for q in body["queued"]], ["https://n.news.naver.com/a/1", "https://n.news.naver.com/a/2"])
+        self.assertEqual(body["rejected"], ["https://example.com/x"])
+        self.assertEqual(
+            set(Link.objects.filter(user=self.user, status="PENDING").values_list("url", flat=True)),
+            {"https://n.news.naver.com/a/1", "https://n.news.naver.com/a/2"},
+        )
+        self.assertEqual(self.queued_ids(), sorted(q["id"] for q in body["queued"]))
+        self.group.return_value.apply_async.assert_called_once_with()
+
+    def test_duplicate_urls_in_one_payload_are_created_once(self):
+        url = "https://n.news.naver.com/a/1"
+        res = self.post_urls([url, f" {url} ", url])
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(len(res.json()["queued"]), 1)
+        self.assertEqual(Link.objects.filter(user=self.user, url=url).count(), 1)
+
+    def test_existing_active_link_is_reused(self):
+        existing = Link.objects.create(user=self.user, url="https://n.news.naver.com/a/1", status="PROCESSING")
+        res = self.post_urls(["https://n.news.naver.com/a/1", "https://n.news.naver.com/a/2"])
+        self.assertEqual(res.status_code, 201)
+        body = res.json()
+        self.assertEqual(body["existing"], [{"id": existing.id, "url": existing.url, "status": "PROCESSING"}])
+        self.assertEqual([q["url"] for q in body["queued"]], ["https://n.news.naver.com/a/2"])
+        self.assertEqual(Link.objects.filter(user=self.user, url=existing.url).count(), 1)
+        self.assertNotIn(existing.id, self.queued_ids())
+
+    def test_only_existing_links_returns_200_without_enqueue(self):
+        Link.objects.create(user=self.user, url="https://n.news.naver.com/a/1", status="PENDING")
+        res = self.post_urls(["https://n.news.naver.com/a/1"])
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["queued"], [])
+        self.group.assert_not_called()
+
+    def test_concurrent_insert_falls_back_to_per_url_create(self):
+        # bulk INSERT가 활성 URL 유니크 제약에 걸리면 URL별 create_pending_link로 처리합니다.
+        from django.db import IntegrityError
+
+        with mock.patch.object(Link.objects, "bulk_create", side_effect=IntegrityError):
+            res = self.post_urls(["https://n.news.naver.com/a/1", "https://n.news.naver.com/a/2"])
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(len(res.json()["queued"]), 2)
+        self.assertEqual(Link.objects.filter(user=self.user, status="PENDING").count(), 2)
+
+
+class OrjsonRendererTests(SimpleTestCase):
+    def test_compact_by_default(self):
+        self.assertEqual(OrjsonRenderer().render({"a": [1, "한글"]}), '{"a":[1,"한글"]}'.encode())
+
+    def test_indent_from_accepted_media_type(self):
+        out = OrjsonRenderer().render({"a": 1}, "application/json; indent=4", {})
+        self.assertEqual(out, b'{\n  "a": 1\n}')
+
+    def test_indent_from_renderer_context(self):
+        out = OrjsonRenderer().render({"a": 1}, "application/json", {"indent": 4})
+        self.assertIn(b"\n", out)
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(OrjsonRenderer().render(None), b"")
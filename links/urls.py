@@ -10,6 +10,7 @@ urlpatterns = [
     path('recommendation/<int:pk>/convert/', views.convert_recommendation, name='convert_recommendation'),
     path('stats/', views.stats_page, name='stats_page'),
     path('stats/content/', views.stats_content, name='stats_content'),
+    path('stats/content/poll/', views.stats_content_poll, name='stats_content_poll'),
     path("recommend/interest/", views.htmx_recommend_interest, name="htmx_recommend_interest"),
     path("recommend/explore/", views.htmx_recommend_explore, name="htmx_recommend_explore"),
 
@@ -1,10 +1,22 @@
 # links/utils.py
 
-from collections import Counter
+import logging
+import numpy as np
+import re
+
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from dateutil import parser as date_parser
+from django.core.cache import cache
+from django.db.models import CharField, Count, F, Func, Max
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
+PERSONA_CACHE_TIMEOUT = 60 * 60
+
 CATEGORY_KEYWORDS = {
     'TECH': ['AI', '반도체', '애플', '삼성', 'IT', '개발', '코딩', '소프트웨어', '테크', '모바일', '게임', '과학'],
     'ECONOMY': ['주식', '투자', '금리', '부동산', '시장', '환율', '은행', '경제', '재테크', '코스피', '나스닥'],
@@ -47,32 +59,108 @@ PERSONA_TITLES = {
     }
 }
 
-def determine_persona(completed_links):
+# 카테고리별 키워드를 하나의 정규식으로 컴파일: 기존 중첩 루프와 동일하게 앞선 카테고리가 우선합니다.
+CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+    if keywords
+)
+
+def _substring_category(tag):
+    return next((category for category, pattern in CATEGORY_PATTERNS if pattern.search(tag)), None)
+
+# 태그가 키워드와 정확히 일치하는 경우가 대부분이므로 해시 조회를 먼저 합니다.
+# 값은 부분 문자열 매칭 결과로 채워 두 경로의 우선순위가 항상 같습니다.
+KEYWORD_TO_CAT = {
+    keyword: _substring_category(keyword)
+    for keywords in CATEGORY_KEYWORDS.values()
+    for keyword in keywords
+}
+
+@lru_cache(maxsize=4096)
+def tag_category(tag):
+    """
+    태그가 속한 카테고리를 반환합니다. 매칭되는 키워드가 없으면 None.
+    같은 태그가 여러 기사에 반복되므로 결과를 캐시합니다.
+    """
+    category = KEYWORD_TO_CAT.get(tag)
+    if category is None:
+        category = _substring_category(tag)
+    return category
+
+def top_tags(links_qs, limit):
+    """
+    Link queryset의 tags(JSON 배열)를 DB에서 펼쳐 집계하고, 많이 등장한 순으로 [(tag, count), ...]를 반환합니다.
+    limit이 None이면 전체 태그를 반환합니다.
+    """
+    rows = (
+        links_qs
+        .alias(tags_type=Func(F('tags'), function='jsonb_typeof', output_field=CharField()))
+        .filter(tags_type='array')
+        .annotate(tag=Func(F('tags'), function='jsonb_array_elements_text', output_field=CharField()))
+        .values('tag')
+        .annotate(n=Count('*'))
+        .order_by('-n', 'tag')
+        .values_list('tag', 'n')
+    )
+    return list(rows if limit is None else rows[:limit])
+
+def completed_links_version(completed_links):
+    """
+    완료 기사 집합이 바뀌었는지 판단하는 가벼운 버전 문자열(건수:최종 수정 시각)을 반환합니다.
+    기사가 완료/삭제/수정되면 값이 달라지므로 캐시 키에 넣으면 별도 무효화가 필요 없습니다.
+    """
+    return completed_links_count_and_version(completed_links)[1]
+
+def completed_links_count_and_version(completed_links):
+    """
+    (완료 기사 수, 버전 문자열)을 한 번의 집계 쿼리로 반환합니다. 건수가 따로 필요할 때 COUNT(*)를 또 날리지 않기 위함입니다.
+    """
+    agg = completed_links.aggregate(n=Count('id'), m=Max('updated_at'))
+    return agg['n'], f"{agg['n']}:{agg['m'].timestamp() if agg['m'] else 0}"
+
+def _cached(key, compute):
+    try:
+        value = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Persona Cache Read Error: {e}")
+        return compute()
+
+    if value is None:
+        value = compute()
+        try:
+            cache.set(key, value, timeout=PERSONA_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Persona Cache Write Error: {e}")
+    return value
+
+def determine_persona(completed_links, user_id=None):
     """
     읽은 기사들의 태그를 분석하여 페르소나(칭호, 설명, 이모지)를 반환합니다.
+    user_id를 주면 완료 기사 버전별로 결과를 캐시합니다.
     """
-    if not completed_links.exists():
-        return {'title': '👻 투명한 유령', 'desc': '아직 읽은 기사가 없어요!'}
+    if user_id is None:
+        return _determine_persona(completed_links)
+    version = completed_links_version(completed_links)
+    return _cached(f"persona:{user_id}:{version}", lambda: _determine_persona(completed_links))
 
-    all_tags = []
-    for link in completed_links:
-        if link.tags:
-            all_tags.extend(link.tags)
-    
+def _determine_persona(completed_links):
     total_read_count = completed_links.count()
+    if not total_read_count:
+        return {'title': '👻 투명한 유령', 'desc': '아직 읽은 기사가 없어요!'}
+
+    # 태그 목록 전체를 가져오지 않고 DB에서 (태그, 건수) 히스토그램만 받아옵니다. (기사 수가 많아도 메모리 일정)
+    tag_counts = top_tags(completed_links, None)
     
     scores = {key: 0 for key in CATEGORY_KEYWORDS.keys()}
     scores['GENERAL'] = 0 
 
-    for tag in all_tags:
-        matched = False
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            if any(k in tag for k in keywords):
-                scores[category] += 1
-                matched = True
-                break
-        if not matched:
-            scores['GENERAL'] += 0.5 
+    for tag, count in tag_counts:
+        category = tag_category(tag)
+        if category:
+            scores[category] += count
+        else:
+            scores['GENERAL'] += 0.5 * count
 
     dominant_category = max(scores, key=scores.get)
     if scores[dominant_category] < 3:
@@ -95,28 +183,25 @@ def determine_persona(completed_links):
 def analyze_knowledge_gap(user):
     """
     유저의 읽은 기사 데이터를 분석하여 강점(Strong)과 약점(Weak) 카테고리를 반환합니다.
+    완료 기사 버전별로 결과를 캐시합니다.
     """
     from .models import Link
-    from collections import Counter
 
     completed_links = Link.objects.filter(user=user, status='COMPLETED')
-    
-    if not completed_links.exists():
-        return ['TECH'], ['ECONOMY', 'POLITICS']
+    version = completed_links_version(completed_links)
+    return _cached(f"knowledge_gap:{user.id}:{version}", lambda: _analyze_knowledge_gap(completed_links))
 
-    all_tags = []
-    for link in completed_links:
-        if link.tags:
-            all_tags.extend(link.tags)
+def _analyze_knowledge_gap(completed_links):
+    tag_counts = top_tags(completed_links, None)
+    if not tag_counts:
+        return ['TECH'], ['ECONOMY', 'POLITICS']
 
     cat_scores = {k: 0 for k in CATEGORY_KEYWORDS.keys() if k != 'GENERAL'}
     
-    for tag in all_tags:
-        for cat, keywords in CATEGORY_KEYWORDS.items():
-            if cat == 'GENERAL': continue
-            if any(k in tag for k in keywords):
-                cat_scores[cat] += 1
-                break
+    for tag, n in tag_counts:
+        cat = tag_category(tag)
+        if cat:
+            cat_scores[cat] += n
 
     sorted_cats = sorted(cat_scores.items(), key=lambda x: x[1], reverse=True)
     strong_interests = [cat for cat, score in sorted_cats if score > 0][:2]
@@ -128,33 +213,102 @@ def analyze_knowledge_gap(user):
 
     return strong_interests, weak_interests
 
-def is_within_six_months(date_str):
+def is_within_six_months(date_str, six_months_ago=None):
     """
     네이버 pubDate 문자열을 받아 6개월 이내인지 확인합니다.
     예: 'Wed, 07 Jan 2026 14:10:00 +0900'
+    pubDate는 RFC 2822 형식이므로 전용 파서를 먼저 쓰고, 실패할 때만 dateutil로 폴백합니다.
+    여러 건을 연달아 검사할 때는 six_months_ago 기준 시각을 한 번 계산해서 넘깁니다.
     """
     try:
-        pub_date = date_parser.parse(date_str)
+        try:
+            pub_date = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            pub_date = date_parser.parse(date_str)
         
         if timezone.is_naive(pub_date):
             pub_date = timezone.make_aware(pub_date)
             
-        six_months_ago = timezone.now() - timedelta(days=180)
+        if six_months_ago is None:
+            six_months_ago = timezone.now() - timedelta(days=180)
         return pub_date >= six_months_ago
     except Exception:
         return False
 
 
-def is_too_similar(new_title, existing_titles, threshold=0.5):
+# 제목 중복 판정 임계값 (문자 trigram Jaccard 기준).
+# 실제 기사 제목 쌍으로 보정: 같은 사건을 다르게 쓴 제목은 0.23~0.47
+# ("삼성전자, 3분기 영업이익 10조 돌파" vs "삼성전자 3분기 영업익 10조원 돌파…반도체 회복" = 0.33),
+# 다른 사건은 대부분 0.2 미만입니다. difflib ratio(0.6)나 단어 Jaccard(0.5)와는 척도가 달라 값을 그대로 쓰면 안 됩니다.
+TITLE_DUP_JACCARD = 0.3
+
+def title_shingles(title, n=3):
     """
-    새 기사 제목과 기존 제목들의 유사도를 비교하여 중복 여부를 판단합니다.
+    제목을 문자 n-gram(shingle) 집합으로 변환합니다.
+    한글 제목은 어절 수가 적어 단어 단위보다 문자 단위가 유사도 판단에 안정적입니다.
     """
-    new_words = set(new_title.split())
-    for title in existing_titles:
-        existing_words = set(title.split())
-        intersection = new_words.intersection(existing_words)
-        union = new_words.union(existing_words)
-        similarity = len(intersection) / len(union) if union else 0
-        if similarity > threshold:
-            return True
-    return False
\ No newline at end of file
+    if len(title) < n:
+        return {title} if title else set()
+    return {title[i:i + n] for i in range(len(title) - n + 1)}
+
+
+class TitleShingleIndex:
+    """
+    제목 shingle 집합들의 역색인(shingle -> 제목 번호)입니다.
+    새 제목과 shingle을 하나라도 공유하는 제목만 후보로 모아 교집합 크기를 세므로,
+    기존 제목 전체와 쌍별로 Jaccard를 계산하지 않고도 같은 결과를 얻습니다.
+    색인 단위는 단어가 아니라 문자 trigram(title_shingles)이므로 임계값도 TITLE_DUP_JACCARD 척도를 따릅니다.
+    """
+
+    def __init__(self, shingle_sets=()):
+        self._postings = defaultdict(list)
+        self._sizes = []
+        for shingles in shingle_sets:
+            self.add(shingles)
+
+    def add(self, shingles):
+        title_id = len(self._sizes)
+        self._sizes.append(len(shingles))
+        for shingle in shingles:
+            self._postings[shingle].append(title_id)
+
+    def is_too_similar(self, shingles, threshold=TITLE_DUP_JACCARD):
+        """
+        shingles(title_shingles 결과)와 Jaccard 유사도가 threshold를 넘는 제목이 있는지 확인합니다.
+        """
+        overlaps = Counter()
+        for shingle in shingles:
+            postings = self._postings.get(shingle)
+            if postings:
+                overlaps.update(postings)
+
+        size = len(shingles)
+        return any(
+            inter / (size + self._sizes[title_id] - inter) > threshold
+            for title_id, inter in overlaps.items()
+        )
+
+
+def unit_vector(vector):
+    """
+    float32 단위 벡터로 변환합니다. (interest_vector는 정규화되어 저장되지만 이전 데이터 호환용)
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    sq = np.vdot(v, v)
+    return v / np.sqrt(sq) if sq > 0 else v
+
+
+def cosine_similarities(vectors, user_unit):
+    """
+    후보 벡터들을 (N, D) 행렬로 쌓아 단위 벡터 user_unit과의 cosine similarity를 한 번의 행렬곱으로 계산합니다.
+    norm이 0인 행은 0.0
+    """
+    if not vectors:
+        return np.zeros(0, dtype=np.float32)
+
+    M = np.stack([np.asarray(v) for v in vectors]).astype(np.float32, copy=False)
+    # 행 norm = sqrt(c·c) : np.linalg.norm의 dispatch 오버헤드 없이 계산
+    row_norms = np.sqrt(np.einsum("ij,ij->i", M, M))
+    sims = np.zeros(len(M), dtype=np.float32)
+    np.divide(M @ user_unit, row_norms, out=sims, where=row_norms > 0)
+    return sims
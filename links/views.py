@@ -1,9 +1,10 @@
-import json
+import hashlib
 import logging
 
+import orjson
+
 from django.shortcuts import get_object_or_404, render, redirect
-from django.db import transaction
-from datetime import timedelta
+from django.db import transaction, IntegrityError
 from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
@@ -20,30 +21,100 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 from django.db.models import Q
+from celery import group
 
-from django.http import JsonResponse
+from django.http import HttpResponse, QueryDict
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 
-from collections import Counter
 from django.shortcuts import render
-from django.db.models import Count
-from django.db.models.functions import TruncDate
-from pgvector.django import CosineDistance
-from .ai import analyze_user_interest
-
-from .models import Link, UserProfile
-from .tasks import crawl_and_save_link, recommend_articles_for_user, recommend_exploratory_articles
-from .serializers import LinkSerializer
-from .utils import determine_persona, CATEGORY_KEYWORDS
+from django.db.models import Count, Max
+
+from .models import Link, UserProfile, invalidate_user_link_urls
+from .tasks import (
+    crawl_and_save_link,
+    recommend_articles_for_user,
+    recommend_exploratory_articles,
+    refresh_stats_snapshot,
+)
+from .serializers import LinkListSerializer, LinkSerializer
+from .utils import top_tags
 
 logger = logging.getLogger(__name__)
 
 
 
+def create_pending_link(user, url):
+    """
+    PENDING 링크를 생성합니다. (user, url) 활성 링크 부분 유니크 인덱스가 중복을 막으므로
+    SELECT FOR UPDATE 없이 바로 INSERT하고, 충돌하면 이미 대기/처리중인 링크를 반환합니다.
+    반환값: (link, created) — 충돌 직후 기존 링크가 끝나 버렸다면 (None, False)
+    """
+    try:
+        with transaction.atomic():
+            link = Link.objects.create(
+                user=user,
+                url=url,
+                status="PENDING",
+                failed_reason="",
+                retry_count=0,
+            )
+        return link, True
+    except IntegrityError:
+        existing = (
+            Link.objects.filter(user=user, url=url, status__in=["PENDING", "PROCESSING"])
+            .only("id", "status")
+            .order_by("-created_at")
+            .first()
+        )
+        return existing, False
+
+
+MAX_BULK_URLS = 50
+
+
+def create_pending_links(user, urls):
+    """
+    여러 URL을 한 번의 INSERT로 PENDING 링크로 생성합니다.
+    이미 대기/처리중인 URL은 건너뛰고, 그 사이 같은 URL이 등록돼 충돌하면 URL별 create_pending_link로 처리합니다.
+    반환값: (새로 만든 링크 목록, 이미 대기/처리중이던 링크 목록)
+    """
+    active = {
+        link.url: link
+        for link in Link.objects.filter(user=user, url__in=urls, status__in=["PENDING", "PROCESSING"]).only("id", "url", "status")
+    }
+    new_urls = [url for url in urls if url not in active]
+
+    try:
+        with transaction.atomic():
+            created = Link.objects.bulk_create([
+                Link(user=user, url=url, status="PENDING", failed_reason="", retry_count=0)
+                for url in new_urls
+            ])
+    except IntegrityError:
+        created = []
+        for url in new_urls:
+            link, was_created = create_pending_link(user, url)
+            if was_created:
+                created.append(link)
+            elif link is not None:
+                active[url] = link
+
+    if created:
+        # bulk_create는 post_save 시그널을 보내지 않으므로 (커밋 후) URL 캐시를 직접 비웁니다.
+        invalidate_user_link_urls(user.id)
+    return created, list(active.values())
+
+
 class LinkCreateView(APIView):
     authentication_classes = [SessionAuthentication, BasicAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        if "urls" in request.data:
+            return self.post_bulk(request)
+
         url = (request.data.get("url") or "").strip()
         if not url:
             return Response({"detail": "url is required"}, status=status.HTTP_400_BAD_REQUEST)
@@ -51,30 +122,47 @@ class LinkCreateView(APIView):
         if "naver.com" not in url:
             return Response({"detail": "Only Naver URLs are allowed"}, status=status.HTTP_400_BAD_REQUEST)
 
-        with transaction.atomic():
-            existing = (
-                Link.objects.select_for_update()
-                .filter(user=request.user, url=url, status__in=["PENDING", "PROCESSING"])
-                .order_by("-created_at")
-                .first()
-            )
-            if existing:
-                return Response(
-                    {"id": existing.id, "status": existing.status, "message": "Already queued/processing"},
-                    status=status.HTTP_200_OK,
-                )
-
-            link = Link.objects.create(
-                user=request.user,
-                url=url,
-                status="PENDING",
-                failed_reason="",
-                retry_count=0,
+        link, created = create_pending_link(request.user, url)
+        if not created:
+            if link is None:
+                return Response({"detail": "Link state changed, please retry"}, status=status.HTTP_409_CONFLICT)
+            return Response(
+                {"id": link.id, "status": link.status, "message": "Already queued/processing"},
+                status=status.HTTP_200_OK,
             )
 
         crawl_and_save_link.delay(link.id)
         return Response({"id": link.id, "status": link.status, "message": "Queued"}, status=status.HTTP_201_CREATED)
 
+    def post_bulk(self, request):
+        # form/multipart(QueryDict)는 get()이 마지막 값만 주므로 getlist()로 urls=a&urls=b를 모두 받습니다.
+        if isinstance(request.data, QueryDict):
+            urls = request.data.getlist("urls")
+        else:
+            urls = request.data.get("urls")
+        if not isinstance(urls, list) or not urls:
+            return Response({"detail": "urls must be a non-empty list"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(urls) > MAX_BULK_URLS:
+            return Response({"detail": f"At most {MAX_BULK_URLS} urls per request"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 순서를 유지하며 중복 제거
+        urls = list(dict.fromkeys(str(u).strip() for u in urls if u and str(u).strip()))
+        rejected = [u for u in urls if "naver.com" not in u]
+        urls = [u for u in urls if "naver.com" in u]
+
+        created, existing = create_pending_links(request.user, urls) if urls else ([], [])
+        if created:
+            group(crawl_and_save_link.s(link.id) for link in created).apply_async()
+
+        return Response(
+            {
+                "queued": [{"id": link.id, "url": link.url} for link in created],
+                "existing": [{"id": link.id, "url": link.url, "status": link.status} for link in existing],
+                "rejected": rejected,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
 
 class LinkListView(APIView):
     permission_classes = [IsAuthenticated]
@@ -89,13 +177,10 @@ class LinkListView(APIView):
         q = (request.query_params.get("q") or "").strip()
         if q:
             qs = qs.filter(
-                title__icontains=q
-            ) | qs.filter(
-                publisher__icontains=q
-            ) | qs.filter(
-                summary__icontains=q
-            ) | qs.filter(
-                content__icontains=q
+                Q(title__icontains=q)
+                | Q(publisher__icontains=q)
+                | Q(summary__icontains=q)
+                | Q(content__icontains=q)
             )
 
         ordering = (request.query_params.get("ordering") or "-created_at").strip()
@@ -104,8 +189,24 @@ class LinkListView(APIView):
             ordering = "-created_at"
         qs = qs.order_by(ordering)
 
-        serializer = LinkSerializer(qs[:200], many=True)
-        return Response(serializer.data)
+        # 같은 조건의 목록은 링크 버전이 바뀌기 전까지 직렬화 결과를 재사용합니다.
+        params = hashlib.md5(f"{st}|{q}|{ordering}".encode()).hexdigest()
+        cache_key = f"linkapi:{request.user.id}:{link_list_version(request.user)}:{params}"
+        try:
+            data = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"[link_api] cache read error user={request.user.id}: {e}")
+            data = None
+
+        if data is None:
+            # 목록 시리얼라이저가 쓰는 컬럼만 읽습니다. (본문/임베딩/태그 등은 제외, FK 접근 없음)
+            data = LinkListSerializer(qs.only(*LinkListSerializer.Meta.fields)[:200], many=True).data
+            try:
+                cache.set(cache_key, data, timeout=LINK_LIST_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"[link_api] cache write error user={request.user.id}: {e}")
+
+        return Response(data)
 
 
 class LinkDetailView(APIView):
@@ -121,22 +222,26 @@ class LinkRetryView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, link_id: int):
-        with transaction.atomic():
-            link = get_object_or_404(Link.objects.select_for_update(), id=link_id, user=request.user)
-
+        # 상태 확인 + 변경을 조건부 UPDATE 한 번으로 처리합니다. (행 잠금/추가 SELECT 없음)
+        try:
+            with transaction.atomic():
+                updated = Link.objects.filter(
+                    id=link_id, user=request.user, status__in=("FAILED", "PARTIAL", "PENDING")
+                ).update(status="PENDING", failed_reason="", updated_at=timezone.now())
+        except IntegrityError:
+            # 같은 URL의 다른 링크가 이미 대기/처리중
+            return Response({"detail": "Same URL already queued/processing"}, status=status.HTTP_409_CONFLICT)
+
+        if not updated:
+            # 0건이면 없는 링크(404)인지, 재시도 불가 상태인지 구분합니다.
+            link = get_object_or_404(Link.objects.only("id", "status"), id=link_id, user=request.user)
             if link.status == "PROCESSING":
                 return Response({"detail": "Already processing"}, status=status.HTTP_409_CONFLICT)
+            return Response({"detail": f"Retry not allowed for status={link.status}"},
+                            status=status.HTTP_400_BAD_REQUEST)
 
-            if link.status not in ("FAILED", "PARTIAL", "PENDING"):
-                return Response({"detail": f"Retry not allowed for status={link.status}"},
-                                status=status.HTTP_400_BAD_REQUEST)
-
-            link.status = "PENDING"
-            link.failed_reason = ""
-            link.save(update_fields=["status", "failed_reason", "updated_at"])
-
-        crawl_and_save_link.delay(link.id)
-        return Response({"id": link.id, "status": link.status, "message": "Re-queued"}, status=status.HTTP_200_OK)
+        crawl_and_save_link.delay(link_id)
+        return Response({"id": link_id, "status": "PENDING", "message": "Re-queued"}, status=status.HTTP_200_OK)
     
 
 class SignUpView(CreateView):
@@ -150,35 +255,61 @@ class SignUpView(CreateView):
 
 
 
+LINK_LIST_CACHE_TIMEOUT = 60 * 5
+
+
 def get_link_context(user):
-    stale_cutoff = timezone.now() - timedelta(minutes=10)
-    Link.objects.filter(
-        user=user,
-        status='PROCESSING',
-        updated_at__lt=stale_cutoff
-    ).update(status='FAILED', failed_reason='STALE_PROCESSING_TIMEOUT')
-
-    Link.objects.filter(
-        user=user,
-        status='PENDING',
-        updated_at__lt=stale_cutoff
-    ).update(status='FAILED', failed_reason='STALE_PENDING_TIMEOUT')
-
-    links = Link.objects.filter(
-        user=user,
-        status__in=['COMPLETED', 'RECOMMENDED', 'FAILED', 'PARTIAL']
-    ).order_by('-created_at')
-    
-    has_pending = Link.objects.filter(
-        user=user,
-        status__in=['PENDING', 'PROCESSING']
-    ).exists()
+    # 목록과 진행중 여부를 한 번의 조회로 판단합니다.
+    user_links = list(
+        Link.objects.filter(user=user)
+        .only('id', 'url', 'title', 'summary', 'tags', 'image_url', 'status', 'recommendation_type', 'created_at')
+        .order_by('-created_at')
+    )
+    links = [
+        link for link in user_links
+        if link.status in ('COMPLETED', 'RECOMMENDED', 'FAILED', 'PARTIAL')
+    ]
+    has_pending = any(link.status in ('PENDING', 'PROCESSING') for link in user_links)
     
     return {
         'links': links,
         'has_pending': has_pending
     }
 
+
+def link_list_version(user):
+    """
+    유저 링크 전체의 (링크 수, 최종 수정 시각) 버전 문자열. 링크가 추가/삭제/변경되면 값이 달라집니다.
+    """
+    version = Link.objects.filter(user=user).aggregate(n=Count('id'), m=Max('updated_at'))
+    return f"{version['n']}:{version['m'].timestamp() if version['m'] else 0}"
+
+
+def render_link_list(request, version=None):
+    """
+    link_list partial HTML을 반환합니다.
+    link_list_version을 캐시 키에 넣어, 링크가 추가/삭제/변경되면 자동으로 새로 렌더링합니다.
+    """
+    user = request.user
+    if version is None:
+        version = link_list_version(user)
+    cache_key = f"linklist:{user.id}:{version}"
+
+    try:
+        html = cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"[link_list] cache read error user={user.id}: {e}")
+        html = None
+
+    if html is None:
+        html = render_to_string('links/partials/link_list.html', get_link_context(user), request=request)
+        try:
+            cache.set(cache_key, str(html), timeout=LINK_LIST_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"[link_list] cache write error user={user.id}: {e}")
+
+    return mark_safe(html)
+
 @login_required
 @require_POST
 def htmx_link_create(request):
@@ -191,26 +322,11 @@ def htmx_link_create(request):
     if not url or "naver.com" not in url:
         pass 
     else:
-        with transaction.atomic():
-            existing = (
-                Link.objects.select_for_update()
-                .filter(user=request.user, url=url, status__in=["PENDING", "PROCESSING"])
-                .order_by("-created_at")
-                .first()
-            )
-            
-            if not existing:
-                link = Link.objects.create(
-                    user=request.user,
-                    url=url,
-                    status="PENDING",
-                    failed_reason="",
-                    retry_count=0,
-                )
-                crawl_and_save_link.delay(link.id)
+        link, created = create_pending_link(request.user, url)
+        if created:
+            crawl_and_save_link.delay(link.id)
 
-    context = get_link_context(request.user)
-    return render(request, 'links/partials/link_list.html', context)
+    return HttpResponse(render_link_list(request))
 
 
 @login_required
@@ -221,8 +337,7 @@ def htmx_recommend_interest(request):
     """
     res = recommend_articles_for_user.delay(request.user.id)
     logger.info(f"[HTMX] interest recommend queued user={request.user.id} task_id={res.id}")
-    context = get_link_context(request.user)
-    return render(request, "links/partials/link_list.html", context)
+    return HttpResponse(render_link_list(request))
 
 @login_required
 @require_POST
@@ -232,41 +347,59 @@ def htmx_recommend_explore(request):
     """
     res = recommend_exploratory_articles.delay(request.user.id)
     logger.info(f"[HTMX] explore recommend queued user={request.user.id} task_id={res.id}")
-
-    context = get_link_context(request.user)
-    return render(request, "links/partials/link_list.html", context)
+    return HttpResponse(render_link_list(request))
 
 @login_required
 def index(request):
-    context = get_link_context(request.user)
-    links = context['links']
-    all_tags = []
-    for link in links:
-        if link.status == 'COMPLETED' and link.tags:
-            all_tags.extend(link.tags)
-    
-    tag_counts = Counter(all_tags).most_common(5)
+    version = link_list_version(request.user)
+    link_list_html = render_link_list(request, version)
+
+    # HTMX 폴링은 리스트 partial만 쓰므로 차트 집계를 건너뜁니다.
+    if request.headers.get('HX-Request'):
+        return HttpResponse(link_list_html)
+
+    # 차트용 상위 태그도 같은 버전으로 캐시합니다. (링크가 바뀌지 않으면 태그 집계 쿼리 없음)
+    cache_key = f"index_tags:{request.user.id}:{version}"
+    try:
+        tag_counts = cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"[index] cache read error user={request.user.id}: {e}")
+        tag_counts = None
+
+    if tag_counts is None:
+        tag_counts = top_tags(Link.objects.filter(user=request.user, status='COMPLETED'), 5)
+        try:
+            cache.set(cache_key, tag_counts, timeout=LINK_LIST_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"[index] cache write error user={request.user.id}: {e}")
+
     chart_labels = [tag for tag, count in tag_counts]
     chart_data = [count for tag, count in tag_counts]
 
-    context.update({
+    context = {
+        'link_list_html': link_list_html,
         'chart_labels': chart_labels,
         'chart_data': chart_data,
-    })
-    
-    if request.headers.get('HX-Request'):
-        return render(request, 'links/partials/link_list.html', context)
+    }
     
     return render(request, 'links/index.html', context)
 
 
 def convert_recommendation(request, pk):
-    link = get_object_or_404(Link, pk=pk, user=request.user)
-    
-    if link.status == 'RECOMMENDED':
-        link.status = 'PENDING'
-        link.save(update_fields=['status'])
-        
+    # 리다이렉트에는 url만 필요하므로 본문/임베딩 컬럼은 읽지 않습니다.
+    link = get_object_or_404(Link.objects.only("id", "url"), pk=pk, user=request.user)
+
+    # 상태 확인 + 변경을 조건부 UPDATE 한 번으로 처리 (중복 클릭 시 0건 → 재큐잉 없음)
+    try:
+        with transaction.atomic():
+            converted = Link.objects.filter(pk=link.pk, status='RECOMMENDED').update(
+                status='PENDING', updated_at=timezone.now()
+            )
+    except IntegrityError:
+        # 같은 URL을 이미 직접 저장해 대기/처리중이면 그 작업에 맡깁니다.
+        return redirect(link.url)
+
+    if converted:
         crawl_and_save_link.delay(link.id)
     return redirect(link.url)
 
@@ -286,123 +419,81 @@ def stats_page(request):
 
     context = {
         "has_snapshot": True,
-        "snapshot_updated_at": profile.stats_snapshot_updated_at,
+        **stats_snapshot_context(snapshot, profile.stats_snapshot_updated_at),
+    }
+
+    return render(request, "links/stats.html", context)
+
+
+STATS_REFRESH_TIMEOUT = 120
+
+
+def stats_snapshot_context(snapshot, snapshot_updated_at):
+    return {
+        "snapshot_updated_at": snapshot_updated_at,
 
         "persona": snapshot.get("persona"),
         "ai_insight": snapshot.get("ai_insight"),
+        "insight_needs_more": snapshot.get("insight_needs_more", 0),
         "total_count": snapshot.get("total_count", 0),
 
-        "tag_labels": json.dumps(snapshot.get("tag_labels", []), ensure_ascii=False),
-        "tag_data": json.dumps(snapshot.get("tag_data", [])),
-        "cat_labels": json.dumps(snapshot.get("cat_labels", []), ensure_ascii=False),
-        "cat_data": json.dumps(snapshot.get("cat_data", [])),
-        "trend_labels": json.dumps(snapshot.get("trend_labels", []), ensure_ascii=False),
-        "trend_data": json.dumps(snapshot.get("trend_data", [])),
+        "tag_labels": snapshot.get("tag_labels", []),
+        "tag_data": snapshot.get("tag_data", []),
+        "cat_labels": snapshot.get("cat_labels", []),
+        "cat_data": snapshot.get("cat_data", []),
+        "trend_labels": snapshot.get("trend_labels", []),
+        "trend_data": snapshot.get("trend_data", []),
     }
 
-    return render(request, "links/stats.html", context)
-
 
 @login_required
 def stats_content(request):
     """
     '새로고침 버튼'으로만 호출되는 HTMX partial.
-    - 통계 계산 + AI 브리핑 생성(원하면)
-    - 결과를 UserProfile.stats_snapshot에 저장
-    - partial(stats_content.html) 반환
+    - 통계 계산 + AI 브리핑 생성은 Celery(refresh_stats_snapshot)로 넘기고
+    - 계산중 partial(stats_pending.html)을 바로 반환 → stats_content_poll로 완료를 폴링
     """
     user = request.user
-    profile, _ = UserProfile.objects.get_or_create(user=user)
-
-    completed_links = Link.objects.filter(user=user, status="COMPLETED")
 
-    if not completed_links.exists():
+    if not Link.objects.filter(user=user, status="COMPLETED").exists():
         return render(request, "links/partials/stats_empty.html")
 
-    ai_insight = None
-    if profile.interest_vector is not None:
-        closest_links = (
-            Link.objects.filter(user=user, status="COMPLETED", embedding__isnull=False)
-            .annotate(distance=CosineDistance("embedding", profile.interest_vector))
-            .order_by("distance")[:5]
-        )
-        representative_texts = [l.title for l in closest_links if l.title]
-        if representative_texts:
-            try:
-                ai_insight = analyze_user_interest(representative_texts)
-            except Exception as e:
-                logger.warning(f"[stats_content] analyze_user_interest error user={user.id}: {e}")
-                ai_insight = None
-
-    persona = determine_persona(completed_links)
-
-    all_tags = []
-    for link in completed_links:
-        if link.tags:
-            all_tags.extend(link.tags)
-
-    tag_counts = Counter(all_tags).most_common(10)
-    tag_labels = [tag for tag, count in tag_counts]
-    tag_data = [count for tag, count in tag_counts]
-
-    cat_scores = {k: 0 for k in CATEGORY_KEYWORDS.keys()}
-    for tag in all_tags:
-        for cat, keywords in CATEGORY_KEYWORDS.items():
-            if any(k in tag for k in keywords):
-                cat_scores[cat] += 1
-                break
-    cat_labels = list(cat_scores.keys())
-    cat_data = list(cat_scores.values())
-
-    daily_stats = (
-        completed_links
-        .annotate(date=TruncDate("created_at"))
-        .values("date")
-        .annotate(count=Count("id"))
-        .order_by("date")
-    )
-    trend_labels = [item["date"].strftime("%m-%d") for item in daily_stats][-14:]
-    trend_data = [item["count"] for item in daily_stats][-14:]
-
-    snapshot = {
-        "persona": persona,
-        "ai_insight": ai_insight,
-        "total_count": completed_links.count(),
-
-        "tag_labels": tag_labels,
-        "tag_data": tag_data,
-        "cat_labels": cat_labels,
-        "cat_data": cat_data,
-        "trend_labels": trend_labels,
-        "trend_data": trend_data,
-    }
+    since = timezone.now().timestamp()
+    refresh_stats_snapshot.delay(user.id)
+    return render(request, "links/partials/stats_pending.html", {"since": since})
 
-    profile.stats_snapshot = snapshot
-    profile.stats_snapshot_updated_at = timezone.now()
-    profile.save(update_fields=["stats_snapshot", "stats_snapshot_updated_at"])
 
-    context = {
-        "persona": persona,
-        "ai_insight": ai_insight,
-        "total_count": snapshot["total_count"],
-
-        "tag_labels": json.dumps(tag_labels, ensure_ascii=False),
-        "tag_data": json.dumps(tag_data),
-        "cat_labels": json.dumps(cat_labels, ensure_ascii=False),
-        "cat_data": json.dumps(cat_data),
-        "trend_labels": json.dumps(trend_labels, ensure_ascii=False),
-        "trend_data": json.dumps(trend_data),
-
-        "snapshot_updated_at": profile.stats_snapshot_updated_at,
-    }
+@login_required
+def stats_content_poll(request):
+    """
+    stats_pending.html이 주기적으로 호출합니다.
+    snapshot이 요청 시각(since) 이후로 갱신됐으면 stats_content partial을, 아니면 계산중 partial을 다시 반환합니다.
+    (STATS_REFRESH_TIMEOUT이 지나면 기존 snapshot을 보여주고 폴링을 멈춤)
+    """
+    try:
+        since = float(request.GET.get("since", ""))
+    except ValueError:
+        since = 0.0
+
+    profile, _ = UserProfile.objects.get_or_create(user=request.user)
+    updated_at = profile.stats_snapshot_updated_at
+    refreshed = updated_at is not None and updated_at.timestamp() >= since
+    timed_out = timezone.now().timestamp() - since > STATS_REFRESH_TIMEOUT
+
+    if not refreshed and not timed_out:
+        return render(request, "links/partials/stats_pending.html", {"since": since})
+
+    snapshot = profile.stats_snapshot or {}
+    if not snapshot.get("total_count"):
+        return render(request, "links/partials/stats_empty.html")
 
-    return render(request, "links/partials/stats_content.html", context)
+    return render(request, "links/partials/stats_content.html", stats_snapshot_context(snapshot, updated_at))
 
 
 @login_required
 def api_whoami(request):
-    return JsonResponse({
+    return HttpResponse(orjson.dumps({
         "id": request.user.id,
         "username": request.user.username,
         "is_superuser": request.user.is_superuser,
-    })
\ No newline at end of file
+    }), content_type="application/json")
\ No newline at end of file